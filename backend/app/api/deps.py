@@ -1,12 +1,10 @@
 from typing import Generator, Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import jwt, JWTError
-from pydantic import ValidationError
 from app.core import security
 from app.core.config import settings
 from app.models.user import User
-from app.db.mongodb import get_database
+from app.db.mongodb import get_database, get_read_database
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from bson import ObjectId
 
@@ -16,6 +14,10 @@ async def get_db() -> AsyncIOMotorDatabase:
     db = await get_database()
     return db
 
+async def get_read_db() -> AsyncIOMotorDatabase:
+    db = await get_read_database()
+    return db
+
 async def get_current_user(
     db: AsyncIOMotorDatabase = Depends(get_db),
     token: Optional[str] = Depends(oauth2_scheme)
@@ -29,21 +31,9 @@ async def get_current_user(
             disabled=False
         )
 
-    try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[security.ALGORITHM]
-        )
-        token_data = payload.get("sub")
-        if token_data is None:
-             # Fallback to guest instead of error for smooth persistence
-             return User(
-                id="guest_id_00000000000000",
-                email="guest@example.com",
-                full_name="Guest User",
-                disabled=False
-            )
-    except (JWTError, ValidationError):
-         # Fallback to guest
+    token_data = security.decode_access_token(token)
+    if token_data is None:
+         # Fallback to guest instead of error for smooth persistence
          return User(
             id="guest_id_00000000000000",
             email="guest@example.com",
@@ -65,6 +55,4 @@ async def get_current_user(
             disabled=False
         )
     
-    # helper to convert _id to id string for pydantic
-    user_doc["_id"] = str(user_doc["_id"])
-    return User(**user_doc)
+    return User.model_validate(user_doc)
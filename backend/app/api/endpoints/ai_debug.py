@@ -1,5 +1,7 @@
 from fastapi import APIRouter, Body
 from app.services.ai_service import get_llm_service
+from app.core.metrics import metrics
+from app.services.startup import WORKER_ID
 from pydantic import BaseModel
 
 router = APIRouter()
@@ -33,3 +35,12 @@ async def debug_evaluate_answer(request: EvaluateRequest):
         user_answer=request.user_answer
     )
     return evaluation
+
+@router.get("/metrics")
+async def debug_metrics():
+    """
+    Latency and counters collected by the worker that served this request,
+    including LLM calls by provider/model split into cold, warm, unknown,
+    warmup and keep-alive. Other workers keep their own numbers.
+    """
+    return {"worker": WORKER_ID, "scope": "worker", "metrics": metrics.snapshot()}
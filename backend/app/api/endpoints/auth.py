@@ -3,6 +3,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from app.api import deps
 from app.core import security
+from app.core.responses import model_response
 from app.models.user import UserCreate, User, UserInDB
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
@@ -23,7 +24,7 @@ async def register(
             detail="The user with this username already exists in the system.",
         )
     
-    user_data = user_in.dict()
+    user_data = user_in.model_dump()
     hashed_password = security.get_password_hash(user_data.pop("password"))
     user_data["hashed_password"] = hashed_password
     
@@ -32,9 +33,8 @@ async def register(
     
     # Return created user
     new_user = await db.users.find_one({"_id": result.inserted_id})
-    new_user["_id"] = str(new_user["_id"])
     
-    return User(**new_user)
+    return model_response(User.model_validate(new_user))
 
 @router.post("/login")
 async def login(
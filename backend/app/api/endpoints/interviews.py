@@ -1,10 +1,15 @@
-from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException, Body
+from typing import Any, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Body, Query, Request
+from fastapi.responses import StreamingResponse
 from app.api import deps
+from app.core import http_cache
+from app.core.responses import model_response
 from app.models.user import User
 from app.models.interview import Interview, InterviewCreate, Question, Answer, AnswerCreate, AIEvaluation
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from app.services.ai_service import get_llm_service
+from app.services.reports import build_feedback_report
+from app.services.export import EXPORT_MEDIA_TYPES, stream_export
 from bson import ObjectId
 from datetime import datetime
 
@@ -19,10 +24,11 @@ async def start_interview(
     """
     Start a new interview.
     """
-    interview_data = interview_in.dict()
+    interview_data = interview_in.model_dump()
     interview_data["user_id"] = str(current_user.id)
     interview_data["started_at"] = datetime.utcnow()
     interview_data["status"] = "InProgress"
+    interview_data["version"] = 1
     
     result = await db.interviews.insert_one(interview_data)
     
@@ -30,35 +36,77 @@ async def start_interview(
     # Let's let client ask for next question.
     
     interview = await db.interviews.find_one({"_id": result.inserted_id})
-    interview["_id"] = str(interview["_id"])
-    return Interview(**interview)
+    return model_response(Interview.model_validate(interview))
 
 @router.get("/", response_model=List[Interview])
 async def get_interviews(
+    request: Request,
     current_user: User = Depends(deps.get_current_user),
     db: AsyncIOMotorDatabase = Depends(deps.get_db)
 ) -> Any:
     """
     Get all interviews for current user.
     """
-    interviews = []
-    cursor = db.interviews.find({"user_id": str(current_user.id)}).sort("started_at", -1)
-    async for doc in cursor:
-        doc["_id"] = str(doc["_id"])
-        interviews.append(Interview(**doc))
-    return interviews
+    query = {"user_id": str(current_user.id)}
+    # Revalidation only needs ids and versions; full documents are loaded for a 200
+    versions = await db.interviews.find(query, {"_id": 1, "version": 1}).sort("started_at", -1).to_list(length=None)
+    matched = http_cache.matching_etag(request, http_cache.interview_list_etag(versions))
+    if matched:
+        return http_cache.not_modified(matched, http_cache.REVALIDATE_CACHE_CONTROL)
+
+    docs = await db.interviews.find(query).sort("started_at", -1).to_list(length=None)
+    # Computed from what is returned, in case an interview changed in between
+    etag = http_cache.interview_list_etag(docs)
+    interviews = [Interview.model_validate(doc) for doc in docs]
+    return model_response(
+        interviews,
+        headers={"ETag": etag, "Cache-Control": http_cache.REVALIDATE_CACHE_CONTROL}
+    )
+
+@router.get("/export")
+async def export_interviews(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    offset: int = Query(0, ge=0),
+    current_user: User = Depends(deps.get_current_user),
+    db: AsyncIOMotorDatabase = Depends(deps.get_read_db)
+) -> Any:
+    """
+    Stream the current user's interviews with their questions, answers and
+    evaluations. Filter by start date with `start`/`end`. To resume an
+    interrupted NDJSON export pass the last complete line's `offset` + 1; for
+    CSV, discard the rows of the last `offset` received (that interview may be
+    incomplete) and pass that `offset` itself.
+    """
+    filename = f"interviews.{format}"
+    return StreamingResponse(
+        stream_export(db, str(current_user.id), format, start, end, offset),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
 
 @router.get("/{interview_id}", response_model=Interview)
 async def get_interview(
     interview_id: str,
+    request: Request,
     current_user: User = Depends(deps.get_current_user),
     db: AsyncIOMotorDatabase = Depends(deps.get_db)
 ) -> Any:
     interview = await db.interviews.find_one({"_id": ObjectId(interview_id), "user_id": str(current_user.id)})
     if not interview:
         raise HTTPException(status_code=404, detail="Interview not found")
-    interview["_id"] = str(interview["_id"])
-    return Interview(**interview)
+
+    etag = http_cache.interview_etag(interview)
+    cache_control = http_cache.cache_control_for(interview)
+    matched = http_cache.matching_etag(request, etag)
+    if matched:
+        return http_cache.not_modified(matched, cache_control)
+
+    return model_response(
+        Interview.model_validate(interview),
+        headers={"ETag": etag, "Cache-Control": cache_control}
+    )
 
 @router.post("/{interview_id}/next_question", response_model=Question)
 async def next_question(
@@ -101,8 +149,7 @@ async def next_question(
     
     result = await db.questions.insert_one(question_data)
     question = await db.questions.find_one({"_id": result.inserted_id})
-    question["_id"] = str(question["_id"])
-    return Question(**question)
+    return model_response(Question.model_validate(question))
 
 @router.post("/{interview_id}/submit_answer", response_model=Answer)
 async def submit_answer(
@@ -131,20 +178,19 @@ async def submit_answer(
     )
     
     # Parse evaluation to match Schema roughly or store flexible
-    ai_evaluation = AIEvaluation(**evaluation_dict)
+    ai_evaluation = AIEvaluation.model_validate(evaluation_dict)
     
     answer_data = {
         "interview_id": interview_id,
         "question_id": answer_in.question_id,
         "user_answer_text": answer_in.user_answer_text,
-        "ai_evaluation": ai_evaluation.dict(),
+        "ai_evaluation": ai_evaluation.model_dump(),
         "created_at": datetime.utcnow()
     }
     
     result = await db.answers.insert_one(answer_data)
     answer = await db.answers.find_one({"_id": result.inserted_id})
-    answer["_id"] = str(answer["_id"])
-    return Answer(**answer)
+    return model_response(Answer.model_validate(answer))
 
 @router.post("/{interview_id}/complete")
 async def complete_interview(
@@ -156,43 +202,18 @@ async def complete_interview(
     answers_cursor = db.answers.find({"interview_id": interview_id})
     answers = await answers_cursor.to_list(length=100)
     
-    if not answers:
-        # No answers submitted
-        average_score = 0
-        overall_feedback = "No questions were answered."
-    else:
-        # 2. Calculate Stats
-        total_score = sum(a["ai_evaluation"]["score"] for a in answers)
-        average_score = round(total_score / len(answers), 1)
-        
-        # 3. Aggregate Feedback (Simple Calculation for Speed)
-        # We could use LLM here for a summary, but let's stick to stats for instant results
-        # as per user request for "faster".
-        weak_areas = []
-        strong_areas = []
-        for a in answers:
-            if a["ai_evaluation"]["score"] < 6:
-                weak_areas.extend(a["ai_evaluation"].get("missing_points", []))
-            else:
-                strong_areas.append("Good understanding of tested concepts")
-        
-        # Deduplicate
-        weak_areas = list(set(weak_areas))[:5] 
-        
-        feedback_report = {
-            "overall_score": average_score,
-            "total_questions": len(answers),
-            "summary": f"Candidate scored {average_score}/10 on average.",
-            "weak_areas": weak_areas,
-            "strengths": list(set(strong_areas))[:3]
-        }
+    # 2. Calculate stats and aggregate feedback
+    feedback_report = build_feedback_report(answers)
 
     await db.interviews.update_one(
         {"_id": ObjectId(interview_id)},
-        {"$set": {
-            "status": "Completed", 
-            "completed_at": datetime.utcnow(),
-            "feedback_report": feedback_report if answers else None
-        }}
+        {
+            "$set": {
+                "status": "Completed", 
+                "completed_at": datetime.utcnow(),
+                "feedback_report": feedback_report
+            },
+            "$inc": {"version": 1}
+        }
     )
-    return {"message": "Interview completed", "report": feedback_report if answers else None}
+    return {"message": "Interview completed", "report": feedback_report}
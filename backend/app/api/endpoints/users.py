@@ -1,7 +1,7 @@
 from typing import Any
 from fastapi import APIRouter, Body, Depends, HTTPException
-from fastapi.encoders import jsonable_encoder
 from app.api import deps
+from app.core.responses import model_response
 from app.models.user import User
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
@@ -14,7 +14,7 @@ async def read_user_me(
     """
     Get current user.
     """
-    return current_user
+    return model_response(current_user)
 
 @router.put("/me", response_model=User)
 async def update_user_me(
@@ -27,7 +27,6 @@ async def update_user_me(
     """
     Update own user.
     """
-    user_data = jsonable_encoder(current_user)
     update_data = {}
     if skills is not None:
         update_data["skills"] = skills
@@ -43,5 +42,4 @@ async def update_user_me(
     # Note: user_id is generic objectId in pymongo, need to query
     from bson import ObjectId
     updated_user = await db.users.find_one({"_id": ObjectId(current_user.id)})
-    updated_user["_id"] = str(updated_user["_id"])
-    return User(**updated_user)
+    return model_response(User.model_validate(updated_user))
@@ -1,4 +1,4 @@
-from typing import List, Union
+from typing import List, Optional, Union
 from pydantic import AnyHttpUrl, EmailStr, validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -11,9 +11,58 @@ class Settings(BaseSettings):
     MONGODB_URL: str = "mongodb://localhost:27017"
     DATABASE_NAME: str = "ai_mock_interview"
 
+    # Motor connection pool, per worker process. None leaves the driver default.
+    MONGODB_MAX_POOL_SIZE: int = 100
+    MONGODB_MIN_POOL_SIZE: int = 0
+    MONGODB_MAX_IDLE_TIME_MS: Optional[int] = None
+    # How long a request may wait for a free pooled connection
+    MONGODB_WAIT_QUEUE_TIMEOUT_MS: Optional[int] = None
+    MONGODB_CONNECT_TIMEOUT_MS: int = 20000
+    MONGODB_SOCKET_TIMEOUT_MS: Optional[int] = None
+    MONGODB_SERVER_SELECTION_TIMEOUT_MS: int = 30000
+    # Upper bound on the /health/db ping, well inside the probe's own timeout
+    MONGODB_HEALTH_CHECK_TIMEOUT_MS: int = 2000
+    # Wire compression, comma-separated in order of preference, e.g.
+    # "zstd,snappy,zlib" (zstd and snappy need their python packages)
+    MONGODB_COMPRESSORS: str = ""
+    # Read preference for bulk reads that tolerate replication lag (exports):
+    # primary, primaryPreferred, secondary, secondaryPreferred or nearest.
+    # Everything else reads from the primary, since request handlers read
+    # back what they just wrote and leader leases must never be stale.
+    MONGODB_READ_PREFERENCE: str = "primary"
+
+    # Workers sharing a STARTUP_ID elect a leader that runs startup tasks and
+    # the LLM keep-alive. Defaults to the hostname. The leader renews its
+    # lease every third of LEADER_LEASE_SECONDS and releases it on shutdown;
+    # if it dies, another worker takes over once the lease expires.
+    STARTUP_ID: str = ""
+    LEADER_LEASE_SECONDS: int = 30
+    LLM_WARMUP_ENABLED: bool = True
+
+    # LLM warmup and keep-alive. Extra models to keep resident besides the
+    # active one, comma-separated "provider/model" (e.g. "ollama/llama3").
+    LLM_WARMUP_MODELS: str = ""
+    LLM_KEEPALIVE_ENABLED: bool = True
+    # Ping a model once it has been idle this long; keep below the backend's
+    # unload timeout (Ollama's default keep_alive is 5 minutes)
+    LLM_KEEPALIVE_INTERVAL_SECONDS: int = 240
+    # Idle time after which a model is assumed to have been unloaded. /ready
+    # also trusts the last warmup or keep-alive pass for this long.
+    LLM_MODEL_RESIDENCY_SECONDS: int = 300
+
+    # Responses smaller than this (in bytes) are sent uncompressed
+    GZIP_MINIMUM_SIZE: int = 1024
+
     # CORS
     BACKEND_CORS_ORIGINS: List[AnyHttpUrl] = []
 
+    @validator("MONGODB_READ_PREFERENCE")
+    def check_read_preference(cls, v: str) -> str:
+        modes = ("primary", "primaryPreferred", "secondary", "secondaryPreferred", "nearest")
+        if v not in modes:
+            raise ValueError(f"must be one of {', '.join(modes)}")
+        return v
+
     @validator("BACKEND_CORS_ORIGINS", pre=True)
     def assemble_cors_origins(cls, v: Union[str, List[str]]) -> List[str]:
         if isinstance(v, str) and not v.startswith("["):
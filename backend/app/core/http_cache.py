@@ -0,0 +1,87 @@
+import hashlib
+from typing import Iterable, Optional
+from fastapi import Request, Response
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Completed interviews only change when answers are re-evaluated in bulk, so
+# clients may keep them for a day.
+COMPLETED_CACHE_CONTROL = "private, max-age=86400"
+# Anything still in progress must be revalidated on every poll.
+REVALIDATE_CACHE_CONTROL = "private, no-cache"
+# Content-codings the app may apply on top of a representation
+CONTENT_CODINGS = ("gzip",)
+
+def interview_etag(doc: dict) -> str:
+    """
+    Strong ETag for a single interview, derived from its id and write version.
+    """
+    return f'"{doc["_id"]}-{doc.get("version", 0)}"'
+
+def interview_list_etag(docs: Iterable[dict]) -> str:
+    """
+    Strong ETag for a list of interviews. Changes whenever an interview is
+    added, removed, reordered or written to. Lists can always grow, so they
+    are never served with long-lived cache headers.
+    """
+    digest = hashlib.sha1()
+    for doc in docs:
+        digest.update(f'{doc["_id"]}:{doc.get("version", 0)};'.encode())
+    return f'"{digest.hexdigest()}"'
+
+def cache_control_for(doc: dict) -> str:
+    if doc.get("status") == "Completed":
+        return COMPLETED_CACHE_CONTROL
+    return REVALIDATE_CACHE_CONTROL
+
+def _with_coding(etag: str, coding: str) -> str:
+    return f'{etag[:-1]}-{coding}"'
+
+def matching_etag(request: Request, etag: str) -> Optional[str]:
+    """
+    Evaluate If-None-Match against `etag` (weak comparison, as RFC 9110
+    requires for If-None-Match). Tags carrying a content-coding suffix added
+    by ContentCodingETagMiddleware match too. Returns the client's tag that
+    matched, which is what a 304 must echo back, or None.
+    """
+    header: Optional[str] = request.headers.get("if-none-match")
+    if not header:
+        return None
+    if header.strip() == "*":
+        return etag
+    for tag in (tag.strip().removeprefix("W/") for tag in header.split(",")):
+        if tag == etag or any(tag == _with_coding(etag, coding) for coding in CONTENT_CODINGS):
+            return tag
+    return None
+
+def not_modified(etag: str, cache_control: str) -> Response:
+    # A 304 must carry the Vary the 200 would have; GZipMiddleware only adds
+    # it to bodies it compresses, so it is set here
+    return Response(status_code=304, headers={
+        "ETag": etag, "Cache-Control": cache_control, "Vary": "Accept-Encoding"
+    })
+
+class ContentCodingETagMiddleware:
+    """
+    Appends the content-coding to strong ETags of encoded responses
+    ("<id>-<version>-gzip"), so gzip and identity bodies never share a strong
+    validator. Must be added after GZipMiddleware so it wraps it.
+    """
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_coded_etag(message: Message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                coding = headers.get("content-encoding")
+                etag = headers.get("etag")
+                if coding and etag and etag.startswith('"'):
+                    headers["etag"] = _with_coding(etag, coding)
+            await send(message)
+
+        await self.app(scope, receive, send_with_coded_etag)
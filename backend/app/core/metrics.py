@@ -0,0 +1,52 @@
+import threading
+from typing import Dict
+
+class LatencyStats:
+    """
+    Running count/total/min/max for one latency series, in seconds.
+    """
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = 0.0
+
+    def record(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.min = seconds if self.min is None else min(self.min, seconds)
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total / self.count * 1000, 1) if self.count else None,
+            "min_ms": round(self.min * 1000, 1) if self.min is not None else None,
+            "max_ms": round(self.max * 1000, 1),
+        }
+
+class Metrics:
+    """
+    In-process metrics registry. Each worker keeps its own.
+    """
+    def __init__(self):
+        self._latencies: Dict[str, LatencyStats] = {}
+        self._counters: Dict[str, int] = {}
+        # Safe to record from any thread, not just the event loop
+        self._lock = threading.Lock()
+
+    def record_latency(self, name: str, seconds: float):
+        with self._lock:
+            self._latencies.setdefault(name, LatencyStats()).record(seconds)
+
+    def increment(self, name: str, value: int = 1):
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            snapshot = {name: stats.snapshot() for name, stats in sorted(self._latencies.items())}
+            snapshot.update(sorted(self._counters.items()))
+            return snapshot
+
+metrics = Metrics()
@@ -0,0 +1,39 @@
+from typing import Any, Mapping, Optional, Sequence, Union
+import orjson
+from bson import ObjectId
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+def bson_default(obj: Any) -> Any:
+    """
+    orjson `default` hook for the types Motor hands back that orjson does not
+    know about. datetime is serialized natively by orjson.
+    """
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(by_alias=True)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+class MongoJSONResponse(JSONResponse):
+    """
+    Default response class: orjson rendering with BSON-aware encoders.
+    """
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=bson_default, option=orjson.OPT_NON_STR_KEYS)
+
+def model_response(
+    data: Union[BaseModel, Sequence[BaseModel]],
+    status_code: int = 200,
+    headers: Optional[Mapping[str, str]] = None,
+) -> MongoJSONResponse:
+    """
+    Render models that were already validated in the handler. Returning a
+    Response skips FastAPI's second response_model validation pass; the
+    route's response_model is still used for the OpenAPI schema.
+    """
+    if isinstance(data, BaseModel):
+        content = data.model_dump(by_alias=True)
+    else:
+        content = [item.model_dump(by_alias=True) for item in data]
+    return MongoJSONResponse(content, status_code=status_code, headers=headers)
@@ -1,18 +1,100 @@
-from motor.motor_asyncio import AsyncIOMotorClient
+import asyncio
+import time
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo.read_preferences import ReadPreference
 from app.core.config import settings
+from app.core.metrics import metrics
+from app.db.monitoring import command_monitor, pool_monitor
 
 class Database:
     client: AsyncIOMotorClient = None
 
 db = Database()
 
+READ_PREFERENCES = {
+    "primary": ReadPreference.PRIMARY,
+    "primaryPreferred": ReadPreference.PRIMARY_PREFERRED,
+    "secondary": ReadPreference.SECONDARY,
+    "secondaryPreferred": ReadPreference.SECONDARY_PREFERRED,
+    "nearest": ReadPreference.NEAREST,
+}
+
 async def get_database():
     return db.client[settings.DATABASE_NAME]
 
+async def get_read_database():
+    """
+    The database with MONGODB_READ_PREFERENCE applied, for bulk reads that
+    may lag behind the primary. Never use it to read back a write.
+    """
+    return db.client.get_database(
+        settings.DATABASE_NAME, read_preference=READ_PREFERENCES[settings.MONGODB_READ_PREFERENCE]
+    )
+
+def client_options() -> dict:
+    options = {
+        "maxPoolSize": settings.MONGODB_MAX_POOL_SIZE,
+        "minPoolSize": settings.MONGODB_MIN_POOL_SIZE,
+        "maxIdleTimeMS": settings.MONGODB_MAX_IDLE_TIME_MS,
+        "waitQueueTimeoutMS": settings.MONGODB_WAIT_QUEUE_TIMEOUT_MS,
+        "connectTimeoutMS": settings.MONGODB_CONNECT_TIMEOUT_MS,
+        "socketTimeoutMS": settings.MONGODB_SOCKET_TIMEOUT_MS,
+        "serverSelectionTimeoutMS": settings.MONGODB_SERVER_SELECTION_TIMEOUT_MS,
+        "compressors": settings.MONGODB_COMPRESSORS or None,
+    }
+    return {key: value for key, value in options.items() if value is not None}
+
 async def connect_to_mongo():
-    db.client = AsyncIOMotorClient(settings.MONGODB_URL)
+    db.client = AsyncIOMotorClient(
+        settings.MONGODB_URL,
+        event_listeners=[command_monitor, pool_monitor],
+        **client_options()
+    )
     print("Connected to MongoDB")
 
 async def close_mongo_connection():
     db.client.close()
     print("Closed MongoDB connection")
+
+async def check_database() -> dict:
+    """
+    Ping the server and report round-trip time alongside pool usage.
+    """
+    health = {
+        "ok": False,
+        "latency_ms": None,
+        "pool": {
+            "max_size": settings.MONGODB_MAX_POOL_SIZE,
+            **pool_monitor.stats(),
+            "checkout_wait": metrics.snapshot().get("mongo.pool.checkout_wait"),
+        },
+    }
+    start = time.monotonic()
+    try:
+        await asyncio.wait_for(
+            db.client.admin.command("ping"),
+            timeout=settings.MONGODB_HEALTH_CHECK_TIMEOUT_MS / 1000
+        )
+    except asyncio.TimeoutError:
+        print("Database health check timed out")
+        health["error"] = "timeout"
+        return health
+    except Exception as e:
+        # The driver's message names hosts and topology, keep it in the logs
+        print(f"Database health check failed: {e}")
+        health["error"] = "unreachable"
+        return health
+    health["ok"] = True
+    health["latency_ms"] = round((time.monotonic() - start) * 1000, 1)
+    return health
+
+async def ensure_indexes(database: AsyncIOMotorDatabase):
+    """
+    Create the indexes the API queries rely on. Idempotent.
+    """
+    await database.interviews.create_index([("user_id", 1), ("started_at", -1)])
+    await database.questions.create_index("interview_id")
+    await database.answers.create_index("interview_id")
+    await database.users.create_index("email")
+    # Expired job claims are removed by MongoDB itself
+    await database.job_claims.create_index("expires_at", expireAfterSeconds=0)
@@ -0,0 +1,79 @@
+import threading
+from pymongo import monitoring
+from app.core.metrics import metrics
+
+# pymongo calls these listeners from the driver's threads, so everything they
+# touch is lock-protected.
+
+class CommandMonitor(monitoring.CommandListener):
+    """
+    Latency per command name (find, insert, aggregate, ...) and failure counts.
+    """
+    def started(self, event):
+        pass
+
+    def succeeded(self, event):
+        metrics.record_latency(f"mongo.command.{event.command_name}", event.duration_micros / 1e6)
+
+    def failed(self, event):
+        metrics.increment(f"mongo.command.{event.command_name}.failed")
+
+class PoolMonitor(monitoring.ConnectionPoolListener):
+    """
+    Tracks how many connections are open, checked out and waiting, and how
+    long each checkout waited. Sustained waits with checked_out at the pool
+    size mean the pool is the bottleneck.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.open = 0
+        self.checked_out = 0
+        self.waiting = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"open": self.open, "checked_out": self.checked_out, "waiting": self.waiting}
+
+    def _adjust(self, **deltas):
+        with self._lock:
+            for name, delta in deltas.items():
+                setattr(self, name, getattr(self, name) + delta)
+
+    def connection_check_out_started(self, event):
+        self._adjust(waiting=1)
+
+    def connection_checked_out(self, event):
+        self._adjust(waiting=-1, checked_out=1)
+        if event.duration is not None:
+            metrics.record_latency("mongo.pool.checkout_wait", event.duration)
+
+    def connection_check_out_failed(self, event):
+        self._adjust(waiting=-1)
+        metrics.increment(f"mongo.pool.checkout_failed.{event.reason}")
+
+    def connection_checked_in(self, event):
+        self._adjust(checked_out=-1)
+
+    def connection_created(self, event):
+        self._adjust(open=1)
+
+    def connection_closed(self, event):
+        self._adjust(open=-1)
+
+    def connection_ready(self, event):
+        pass
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        metrics.increment("mongo.pool.cleared")
+
+    def pool_closed(self, event):
+        pass
+
+command_monitor = CommandMonitor()
+pool_monitor = PoolMonitor()
@@ -0,0 +1,60 @@
+from datetime import datetime, timedelta
+from typing import Any, Optional
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.errors import DuplicateKeyError
+
+# State shared between workers lives in MongoDB and is only ever changed with
+# single atomic operations, so it is safe with any number of processes.
+
+async def claim_job(db: AsyncIOMotorDatabase, job_id: str, owner: str, ttl_seconds: int) -> bool:
+    """
+    Atomically claim `job_id` for `owner`, or renew the claim if `owner`
+    already holds it. Exactly one owner holds a claim until it expires;
+    everyone else gets False.
+    """
+    now = datetime.utcnow()
+    try:
+        # Matches only an expired claim or our own. If someone else holds an
+        # active one the upsert collides on _id, which is how the losers find out.
+        await db.job_claims.find_one_and_update(
+            {"_id": job_id, "$or": [{"expires_at": {"$lte": now}}, {"owner": owner}]},
+            {"$set": {
+                "owner": owner,
+                "renewed_at": now,
+                "expires_at": now + timedelta(seconds=ttl_seconds)
+            }},
+            upsert=True
+        )
+    except DuplicateKeyError:
+        return False
+    return True
+
+async def release_claim(db: AsyncIOMotorDatabase, job_id: str, owner: str) -> None:
+    """
+    Give up `owner`'s claim on `job_id` so another owner can take it at once.
+    A claim that has already passed to someone else is left alone.
+    """
+    await db.job_claims.delete_one({"_id": job_id, "owner": owner})
+
+async def set_state(db: AsyncIOMotorDatabase, key: str, value: Any) -> None:
+    await db.app_state.update_one(
+        {"_id": key},
+        {"$set": {"value": value, "updated_at": datetime.utcnow()}},
+        upsert=True
+    )
+
+async def set_state_max(db: AsyncIOMotorDatabase, key: str, value: Any) -> None:
+    """
+    Raise the stored value to `value` if it is larger (or unset).
+    """
+    await db.app_state.update_one(
+        {"_id": key},
+        {"$max": {"value": value}, "$set": {"updated_at": datetime.utcnow()}},
+        upsert=True
+    )
+
+async def get_state(db: AsyncIOMotorDatabase, key: str, default: Optional[Any] = None) -> Any:
+    doc = await db.app_state.find_one({"_id": key})
+    if not doc:
+        return default
+    return doc["value"]
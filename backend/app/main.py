@@ -1,11 +1,16 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from app.core.config import settings
-from app.db.mongodb import connect_to_mongo, close_mongo_connection
+from app.core.http_cache import ContentCodingETagMiddleware
+from app.core.responses import MongoJSONResponse
+from app.db.mongodb import connect_to_mongo, close_mongo_connection, check_database
+from app.services import startup
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
-    openapi_url=f"{settings.API_V1_STR}/openapi.json"
+    openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    default_response_class=MongoJSONResponse
 )
 
 # Set all CORS enabled origins
@@ -15,20 +20,49 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],
 )
 
+# Only compress bodies large enough for gzip to pay off
+app.add_middleware(GZipMiddleware, minimum_size=settings.GZIP_MINIMUM_SIZE)
+# Outside GZip, so compressed bodies get their own strong ETag
+app.add_middleware(ContentCodingETagMiddleware)
+
 @app.on_event("startup")
 async def startup_event():
     await connect_to_mongo()
+    startup.start()
 
 @app.on_event("shutdown")
 async def shutdown_event():
+    await startup.stop()
     await close_mongo_connection()
 
 @app.get("/")
 def read_root():
     return {"message": "Welcome to AI Mock Interview Platform API"}
 
+@app.get("/ready")
+async def read_ready():
+    """
+    Readiness probe: green once this worker's Motor pool is warm and the
+    LLM backends have been warmed up.
+    """
+    checks = await startup.check_readiness()
+    ready = all(checks.values())
+    return MongoJSONResponse(
+        {"status": "ready" if ready else "starting", "checks": checks},
+        status_code=200 if ready else 503
+    )
+
+@app.get("/health/db")
+async def read_db_health():
+    """
+    MongoDB ping latency and this worker's connection pool usage.
+    """
+    health = await check_database()
+    return MongoJSONResponse(health, status_code=200 if health["ok"] else 503)
+
 # Import and include routers here later
 from app.api.api import api_router
 app.include_router(api_router, prefix=settings.API_V1_STR)
@@ -1,24 +1,10 @@
-from typing import List, Optional
-from pydantic import BaseModel, Field
+from typing import Annotated, List, Optional
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field
 from datetime import datetime
 from bson import ObjectId
 
-class PyObjectId(ObjectId):
-    @classmethod
-    def __get_validators__(cls):
-        yield cls.validate
-
-    @classmethod
-    def validate(cls, v):
-        if not ObjectId.is_valid(v):
-            raise ValueError("Invalid objectid")
-        return ObjectId(v)
-
-    @classmethod
-    def __get_pydantic_json_schema__(cls, core_schema, handler):
-        json_schema = handler(core_schema)
-        json_schema.update(type="string")
-        return json_schema
+# Accepts raw Mongo ObjectIds and stores them as strings
+PyObjectId = Annotated[str, BeforeValidator(lambda v: str(v) if isinstance(v, ObjectId) else v)]
 
 # --- Schemas ---
 
@@ -28,7 +14,7 @@ class InterviewCreate(BaseModel):
     mode: str = "Text" # Text or Voice
 
 class Interview(BaseModel):
-    id: Optional[str] = Field(alias="_id")
+    id: Optional[PyObjectId] = Field(alias="_id")
     user_id: str
     role: str
     difficulty: str
@@ -36,23 +22,18 @@ class Interview(BaseModel):
     started_at: datetime = Field(default_factory=datetime.utcnow)
     completed_at: Optional[datetime] = None
     feedback_report: Optional[dict] = None
+    version: int = 0 # Bumped on every write, used for ETags
 
-    class Config:
-        populate_by_name = True
-        arbitrary_types_allowed = True
-        json_encoders = {ObjectId: str}
+    model_config = ConfigDict(populate_by_name=True)
 
 class Question(BaseModel):
-    id: Optional[str] = Field(alias="_id")
+    id: Optional[PyObjectId] = Field(alias="_id")
     interview_id: str
     question_text: str
     question_type: str = "Technical"
     order_index: int
 
-    class Config:
-        populate_by_name = True
-        arbitrary_types_allowed = True
-        json_encoders = {ObjectId: str}
+    model_config = ConfigDict(populate_by_name=True)
 
 class AnswerCreate(BaseModel):
     question_id: str
@@ -67,14 +48,11 @@ class AIEvaluation(BaseModel):
     missing_points: List[str]
 
 class Answer(BaseModel):
-    id: Optional[str] = Field(alias="_id")
+    id: Optional[PyObjectId] = Field(alias="_id")
     interview_id: str
     question_id: str
     user_answer_text: str
     ai_evaluation: AIEvaluation
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
-    class Config:
-        populate_by_name = True
-        arbitrary_types_allowed = True
-        json_encoders = {ObjectId: str}
+    model_config = ConfigDict(populate_by_name=True)
@@ -1,23 +1,9 @@
-from typing import List, Optional
-from pydantic import BaseModel, EmailStr, Field
+from typing import Annotated, List, Optional
+from pydantic import BaseModel, BeforeValidator, ConfigDict, EmailStr, Field
 from bson import ObjectId
 
-class PyObjectId(ObjectId):
-    @classmethod
-    def __get_validators__(cls):
-        yield cls.validate
-
-    @classmethod
-    def validate(cls, v):
-        if not ObjectId.is_valid(v):
-            raise ValueError("Invalid objectid")
-        return ObjectId(v)
-
-    @classmethod
-    def __get_pydantic_json_schema__(cls, core_schema, handler):
-        json_schema = handler(core_schema)
-        json_schema.update(type="string")
-        return json_schema
+# Accepts raw Mongo ObjectIds and stores them as strings
+PyObjectId = Annotated[str, BeforeValidator(lambda v: str(v) if isinstance(v, ObjectId) else v)]
 
 class UserBase(BaseModel):
     email: EmailStr
@@ -32,9 +18,6 @@ class UserInDB(UserBase):
     hashed_password: str
 
 class User(UserBase):
-    id: Optional[str] = Field(alias="_id")
+    id: Optional[PyObjectId] = Field(alias="_id")
 
-    class Config:
-        populate_by_name = True
-        arbitrary_types_allowed = True
-        json_encoders = {ObjectId: str}
+    model_config = ConfigDict(populate_by_name=True)
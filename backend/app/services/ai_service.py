@@ -1,10 +1,44 @@
 from abc import ABC, abstractmethod
+import asyncio
 import json
 import os
-from openai import AsyncOpenAI
+import time
+from datetime import datetime
+from typing import Dict, List, Set, Tuple
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.db import shared_state
+from app.db.mongodb import db as mongo, get_database as get_mongo_database
+from app.services.singleflight import SingleFlight
 from app.services.prompts import GENERATE_QUESTIONS_PROMPT, EVALUATE_ANSWER_PROMPT
 
+# (provider, model) -> monotonic time of the last completion this worker sent
+_last_used: Dict[Tuple[str, str], float] = {}
+# The same across all workers lives in MongoDB; lookups give up quickly so a
+# slow database never holds up a completion
+SHARED_LOOKUP_TIMEOUT_SECONDS = 0.5
+# Background lookups and writes, referenced so they aren't garbage collected
+_pending_writes: Set[asyncio.Task] = set()
+
+# Placeholder evaluation returned when the model's output can't be parsed
+EVALUATION_ERROR = {
+    "score": 0, 
+    "correctness": "Error", 
+    "feedback": "AI Error in processing response.",
+    "ideal_answer": "N/A",
+    "improvement_tips": [],
+    "missing_points": [] 
+}
+
+def is_evaluation_error(evaluation: dict) -> bool:
+    return evaluation.get("correctness") == EVALUATION_ERROR["correctness"]
+
+# Identical completions already in flight are shared instead of re-sent
+_inflight = SingleFlight("llm")
+
 class LLMProvider(ABC):
+    name: str = "llm"
+
     @abstractmethod
     async def generate_question(self, role: str, difficulty: str, topic: str = "General") -> str:
         pass
@@ -13,10 +47,116 @@ class LLMProvider(ABC):
     async def evaluate_answer(self, role: str, question: str, user_answer: str) -> dict:
         pass
 
+    @property
+    def _last_used_key(self) -> str:
+        return f"llm_last_used:{self.name}:{self.model_name}"
+
+    def idle_seconds(self) -> float:
+        """
+        Seconds since this worker last used the model (inf if never).
+        """
+        last = _last_used.get((self.name, self.model_name))
+        return float("inf") if last is None else time.monotonic() - last
+
+    async def shared_idle_seconds(self) -> float:
+        """
+        Seconds since any worker last used the model, falling back to this
+        worker's own view when MongoDB is unavailable. inf if unknown.
+        """
+        idle = self.idle_seconds()
+        if mongo.client is None:
+            return idle
+        try:
+            last = await asyncio.wait_for(
+                shared_state.get_state(await get_mongo_database(), self._last_used_key),
+                SHARED_LOOKUP_TIMEOUT_SECONDS
+            )
+        except Exception:
+            return idle
+        if last is None:
+            return idle
+        return min(idle, max((datetime.utcnow() - last).total_seconds(), 0.0))
+
+    def _publish_last_used(self):
+        if mongo.client is None:
+            return
+
+        async def publish():
+            try:
+                await shared_state.set_state_max(await get_mongo_database(), self._last_used_key, datetime.utcnow())
+            except Exception:
+                pass
+
+        # Fire and forget
+        task = asyncio.create_task(publish())
+        _pending_writes.add(task)
+        task.add_done_callback(_pending_writes.discard)
+
+    async def _chat(self, kind: str = "request", **params):
+        """
+        Send a chat completion. Concurrent calls with the same endpoint, model,
+        prompt and parameters are coalesced into one completion.
+        """
+        key = (str(self.client.base_url), self.model_name, json.dumps(params, sort_keys=True))
+        return await _inflight.do(key, lambda: self._timed_chat(kind, params))
+
+    async def _timed_chat(self, kind: str, params: dict):
+        """
+        Record completion latency. User-facing requests are labelled cold when
+        no worker has used the model for longer than it stays loaded, warm
+        otherwise, and unknown when there is no record of any use.
+        """
+        # The idle lookup only picks a metric label, so it runs alongside the
+        # completion and the latency is recorded whenever it answers; the
+        # response is never held up by it
+        idle_lookup = asyncio.create_task(self.shared_idle_seconds()) if kind == "request" else None
+        start = time.monotonic()
+        try:
+            response = await self.client.chat.completions.create(model=self.model_name, **params)
+        except BaseException:
+            if idle_lookup:
+                idle_lookup.cancel()
+            raise
+        end = time.monotonic()
+        _last_used[(self.name, self.model_name)] = end
+        self._publish_last_used()
+
+        if idle_lookup is None:
+            metrics.record_latency(f"llm.{self.name}.{self.model_name}.{kind}", end - start)
+        else:
+            _pending_writes.add(idle_lookup)
+            idle_lookup.add_done_callback(_pending_writes.discard)
+            idle_lookup.add_done_callback(lambda lookup: self._record_request_latency(lookup, end - start))
+        return response
+
+    def _record_request_latency(self, idle_lookup: asyncio.Task, seconds: float):
+        idle = float("inf")
+        if not idle_lookup.cancelled() and idle_lookup.exception() is None:
+            idle = idle_lookup.result()
+        if idle == float("inf"):
+            kind = "unknown"
+        else:
+            kind = "cold" if idle > settings.LLM_MODEL_RESIDENCY_SECONDS else "warm"
+        metrics.record_latency(f"llm.{self.name}.{self.model_name}.{kind}", seconds)
+
+    async def warmup(self, kind: str = "warmup") -> None:
+        """
+        Send the smallest possible completion so the backend loads the model.
+        """
+        await self._chat(
+            kind=kind,
+            messages=[{"role": "user", "content": "ping"}],
+            max_tokens=1,
+        )
+
 class OllamaProvider(LLMProvider):
+    name = "ollama"
+
     def __init__(self, model_name: str = "mistral"):
         # Ollama usually exposes an OpenAI compatible API at /v1 or we can use raw HTTP
         # Using OpenAI client for compatibility with generic local setups usually working on localhost:11434/v1
+        from openai import AsyncOpenAI # imported lazily, it is slow to load
+
         base_url = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434/v1")
         self.client = AsyncOpenAI(
             base_url=base_url,
@@ -26,8 +166,7 @@ class OllamaProvider(LLMProvider):
 
     async def generate_question(self, role: str, difficulty: str, topic: str = "General") -> str:
         prompt = GENERATE_QUESTIONS_PROMPT.format(role=role, difficulty=difficulty, topic=topic)
-        response = await self.client.chat.completions.create(
-            model=self.model_name,
+        response = await self._chat(
             messages=[{"role": "user", "content": prompt}],
             temperature=0.7,
         )
@@ -35,8 +174,7 @@ class OllamaProvider(LLMProvider):
 
     async def evaluate_answer(self, role: str, question: str, user_answer: str) -> dict:
         prompt = EVALUATE_ANSWER_PROMPT.format(role=role, question=question, user_answer=user_answer)
-        response = await self.client.chat.completions.create(
-            model=self.model_name,
+        response = await self._chat(
             messages=[{"role": "user", "content": prompt}],
             temperature=0.2,
             max_tokens=300,
@@ -50,17 +188,14 @@ class OllamaProvider(LLMProvider):
             # Fallback if model doesn't return pure JSON
             # In production, we'd use a robust parser/retry logic
             print(f"Failed to parse JSON: {content}")
-            return {
-                "score": 0, 
-                "correctness": "Error", 
-                "feedback": "AI Error in processing response.",
-                "ideal_answer": "N/A",
-                "improvement_tips": [],
-                "missing_points": [] 
-            }
+            return dict(EVALUATION_ERROR)
 
 class GroqProvider(LLMProvider):
+    name = "groq"
+
     def __init__(self, api_key: str, model_name: str = "mixtral-8x7b-32768"):
+        from openai import AsyncOpenAI # imported lazily, it is slow to load
+
         self.client = AsyncOpenAI(
             base_url="https://api.groq.com/openai/v1",
             api_key=api_key,
@@ -69,8 +204,7 @@ class GroqProvider(LLMProvider):
 
     async def generate_question(self, role: str, difficulty: str, topic: str = "General") -> str:
         prompt = GENERATE_QUESTIONS_PROMPT.format(role=role, difficulty=difficulty, topic=topic)
-        response = await self.client.chat.completions.create(
-            model=self.model_name,
+        response = await self._chat(
             messages=[{"role": "user", "content": prompt}],
             temperature=0.7,
         )
@@ -78,8 +212,7 @@ class GroqProvider(LLMProvider):
 
     async def evaluate_answer(self, role: str, question: str, user_answer: str) -> dict:
         prompt = EVALUATE_ANSWER_PROMPT.format(role=role, question=question, user_answer=user_answer)
-        response = await self.client.chat.completions.create(
-            model=self.model_name,
+        response = await self._chat(
             messages=[{"role": "user", "content": prompt}],
             temperature=0.2,
             max_tokens=300,
@@ -96,3 +229,24 @@ def get_llm_service() -> LLMProvider:
     if groq_key:
         return GroqProvider(api_key=groq_key)
     return OllamaProvider()
+
+def get_configured_providers() -> List[LLMProvider]:
+    """
+    The active provider plus any extra "provider/model" entries listed in
+    LLM_WARMUP_MODELS, e.g. "ollama/llama3".
+    """
+    providers = [get_llm_service()]
+    entries = [e.strip() for e in settings.LLM_WARMUP_MODELS.split(",") if e.strip()]
+    for entry in entries:
+        provider_name, _, model_name = entry.partition("/")
+        if provider_name == "ollama":
+            providers.append(OllamaProvider(model_name=model_name))
+        elif provider_name == "groq" and os.getenv("GROQ_API_KEY"):
+            providers.append(GroqProvider(api_key=os.getenv("GROQ_API_KEY"), model_name=model_name))
+        else:
+            print(f"Skipping LLM warmup entry {entry}: unknown provider or missing API key")
+
+    unique = {}
+    for provider in providers:
+        unique.setdefault((provider.name, provider.model_name), provider)
+    return list(unique.values())
@@ -0,0 +1,126 @@
+import csv
+import io
+from datetime import datetime
+from typing import AsyncIterator, Optional
+import orjson
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from app.core.responses import bson_default
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+CSV_COLUMNS = [
+    "offset", "interview_id", "role", "difficulty", "status", "started_at", "completed_at",
+    "overall_score", "question_order", "question_type", "question_text", "answer_text",
+    "score", "correctness", "feedback", "ideal_answer", "improvement_tips", "missing_points",
+    "answered_at",
+]
+
+def export_pipeline(user_id: str, start: Optional[datetime] = None, end: Optional[datetime] = None,
+                    offset: int = 0) -> list:
+    """
+    One document per interview, oldest first, with its questions (in order)
+    and each question's answers joined in.
+    """
+    match = {"user_id": user_id}
+    if start or end:
+        match["started_at"] = {}
+        if start:
+            match["started_at"]["$gte"] = start
+        if end:
+            match["started_at"]["$lt"] = end
+
+    pipeline = [
+        {"$match": match},
+        {"$sort": {"started_at": 1, "_id": 1}},
+    ]
+    if offset:
+        pipeline.append({"$skip": offset})
+    pipeline.append({"$lookup": {
+        "from": "questions",
+        "let": {"interview_id": {"$toString": "$_id"}},
+        "pipeline": [
+            {"$match": {"$expr": {"$eq": ["$interview_id", "$$interview_id"]}}},
+            {"$sort": {"order_index": 1}},
+            {"$lookup": {
+                "from": "answers",
+                "let": {"question_id": {"$toString": "$_id"}, "interview_id": "$interview_id"},
+                "pipeline": [
+                    {"$match": {"$expr": {"$and": [
+                        {"$eq": ["$interview_id", "$$interview_id"]},
+                        {"$eq": ["$question_id", "$$question_id"]},
+                    ]}}},
+                    {"$sort": {"created_at": 1}},
+                ],
+                "as": "answers",
+            }},
+        ],
+        "as": "questions",
+    }})
+    return pipeline
+
+def _csv_rows(doc: dict):
+    report = doc.get("feedback_report") or {}
+    interview = [
+        doc["offset"], str(doc["_id"]), doc.get("role"), doc.get("difficulty"), doc.get("status"),
+        doc.get("started_at"), doc.get("completed_at"), report.get("overall_score"),
+    ]
+    if not doc["questions"]:
+        yield interview
+    for question in doc["questions"]:
+        asked = [question.get("order_index"), question.get("question_type"), question.get("question_text")]
+        if not question["answers"]:
+            yield interview + asked
+        for answer in question["answers"]:
+            evaluation = answer.get("ai_evaluation") or {}
+            yield interview + asked + [
+                answer.get("user_answer_text"),
+                evaluation.get("score"),
+                evaluation.get("correctness"),
+                evaluation.get("feedback"),
+                evaluation.get("ideal_answer"),
+                "; ".join(evaluation.get("improvement_tips", [])),
+                "; ".join(evaluation.get("missing_points", [])),
+                answer.get("created_at"),
+            ]
+
+async def stream_export(db: AsyncIOMotorDatabase, user_id: str, fmt: str = "ndjson",
+                        start: Optional[datetime] = None, end: Optional[datetime] = None,
+                        offset: int = 0, batch_size: int = 100) -> AsyncIterator[bytes]:
+    """
+    Stream a user's interview history as NDJSON (one interview per line) or
+    CSV (one answer per row). Only one cursor batch is held in memory.
+
+    Every record carries its interview's `offset`. To resume an interrupted
+    NDJSON export pass the last complete line's offset plus one. CSV has
+    several rows per interview, so a cut-off download may end partway through
+    one: drop the rows carrying the last offset seen and resume from that
+    offset itself. Resumed CSV exports have no header row.
+    """
+    cursor = db.interviews.aggregate(
+        export_pipeline(user_id, start, end, offset), allowDiskUse=True, batchSize=batch_size
+    )
+
+    if fmt == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        if not offset:
+            writer.writerow(CSV_COLUMNS)
+        async for doc in cursor:
+            doc["offset"] = offset
+            offset += 1
+            for row in _csv_rows(doc):
+                writer.writerow(row)
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue().encode()
+        return
+
+    async for doc in cursor:
+        doc["offset"] = offset
+        offset += 1
+        yield orjson.dumps(doc, default=bson_default) + b"\n"
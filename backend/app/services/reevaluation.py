@@ -0,0 +1,281 @@
+import asyncio
+import time
+from datetime import datetime
+from typing import Optional
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
+from app.models.interview import AIEvaluation
+from app.services.ai_service import LLMProvider, get_llm_service, is_evaluation_error
+from app.services.reports import build_feedback_report
+
+class Pacer:
+    """
+    Spaces evaluations out to at most `rate` per second across the pool, so a
+    re-evaluation run leaves LLM capacity for live traffic.
+    """
+    def __init__(self, rate: Optional[float]):
+        self.interval = 1 / rate if rate else 0
+        self.next_slot = 0.0
+        self.lock = asyncio.Lock()
+
+    async def wait(self):
+        if not self.interval:
+            return
+        async with self.lock:
+            now = time.monotonic()
+            if self.next_slot > now:
+                await asyncio.sleep(self.next_slot - now)
+            self.next_slot = max(now, self.next_slot) + self.interval
+
+class Progress:
+    def __init__(self, total: int):
+        self.total = total
+        self.processed = 0
+        self.failed = 0
+        self.reports = 0
+        self.started = time.monotonic()
+
+    def line(self) -> str:
+        elapsed = time.monotonic() - self.started
+        rate = self.processed / elapsed if elapsed else 0
+        remaining = max(self.total - self.processed, 0)
+        eta = f"{remaining / rate:.0f}s" if rate else "?"
+        return (
+            f"{self.processed}/{self.total} answers "
+            f"({self.failed} failed, {self.reports} reports) "
+            f"{rate:.2f}/s, eta {eta}"
+        )
+
+async def _evaluate(db: AsyncIOMotorDatabase, llm: LLMProvider, answer: dict, pacer: Pacer) -> UpdateOne:
+    question = None
+    if ObjectId.is_valid(answer["question_id"]):
+        question = await db.questions.find_one({"_id": ObjectId(answer["question_id"])}, {"question_text": 1})
+    interview = None
+    if ObjectId.is_valid(answer["interview_id"]):
+        interview = await db.interviews.find_one({"_id": ObjectId(answer["interview_id"])}, {"role": 1})
+    if not question or not interview:
+        raise LookupError("question or interview missing")
+
+    await pacer.wait()
+    evaluation = await llm.evaluate_answer(
+        role=interview["role"],
+        question=question["question_text"],
+        user_answer=answer["user_answer_text"]
+    )
+    # Never overwrite a stored evaluation with the unparseable-output placeholder
+    if is_evaluation_error(evaluation):
+        raise ValueError("model returned an unparseable evaluation")
+    ai_evaluation = AIEvaluation.model_validate(evaluation)
+    return UpdateOne(
+        {"_id": answer["_id"]},
+        {"$set": {"ai_evaluation": ai_evaluation.model_dump(), "reevaluated_at": datetime.utcnow()}}
+    )
+
+async def refresh_feedback_reports(db: AsyncIOMotorDatabase, interview_ids) -> int:
+    """
+    Rebuild feedback_report for the completed interviews among `interview_ids`.
+    Bumps their version so cached copies are revalidated.
+    """
+    refreshed = 0
+    for interview_id in interview_ids:
+        if not ObjectId.is_valid(interview_id):
+            continue
+        answers = await db.answers.find(
+            {"interview_id": interview_id}, {"ai_evaluation": 1}
+        ).to_list(length=100)
+        result = await db.interviews.update_one(
+            {"_id": ObjectId(interview_id), "status": "Completed"},
+            {"$set": {"feedback_report": build_feedback_report(answers)}, "$inc": {"version": 1}}
+        )
+        refreshed += result.modified_count
+    return refreshed
+
+async def _answers_by_id(db: AsyncIOMotorDatabase, query: dict, batch_size: int):
+    """
+    Yield the answers matching `query` in _id order. Each batch is its own
+    query after the last _id seen, because the queue and pacer can hold a
+    single long-lived cursor idle past the server's cursor timeout.
+    """
+    last_id = None
+    while True:
+        batch_query = dict(query)
+        if last_id is not None:
+            batch_query["_id"] = {**query.get("_id", {}), "$gt": last_id}
+        answers = await db.answers.find(
+            batch_query, {"interview_id": 1, "question_id": 1, "user_answer_text": 1}
+        ).sort("_id", 1).limit(batch_size).to_list(length=batch_size)
+        for answer in answers:
+            yield answer
+        if len(answers) < batch_size:
+            return
+        last_id = answers[-1]["_id"]
+
+class _WorkerPool:
+    """
+    `concurrency` workers fed from a bounded queue, so one slow LLM call never
+    holds up the others. Finished results are flushed every `batch_size`
+    answers: successful evaluations go out in one bulk_write, affected reports
+    are rebuilt, and the checkpoint moves to the highest _id below which every
+    answer has finished.
+
+    With `retry` the answers come from the job's failed_ids instead: the
+    checkpoint is left alone and answers that now succeed are pulled from
+    failed_ids.
+    """
+    def __init__(self, db: AsyncIOMotorDatabase, job_id: str, llm: LLMProvider, concurrency: int,
+                 batch_size: int, pacer: Pacer, progress: Progress, retry: bool = False):
+        self.db = db
+        self.job_id = job_id
+        self.llm = llm
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.pacer = pacer
+        self.progress = progress
+        self.retry = retry
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 2)
+        self.flush_lock = asyncio.Lock()
+
+        # Results waiting for the next flush
+        self.updates = []
+        self.succeeded_ids = []
+        self.failed_ids = []
+        self.interview_ids = set()
+        self.finished_since_flush = 0
+
+        # Contiguous checkpoint bookkeeping: answers are numbered in _id order
+        self.finished = {}
+        self.next_seq = 0
+        self.frontier_id = None
+
+    async def _worker(self):
+        while True:
+            item = await self.queue.get()
+            if item is None:
+                return
+            seq, answer = item
+            try:
+                # Await first: a flush during the call swaps self.updates out
+                update = await _evaluate(self.db, self.llm, answer, self.pacer)
+                self.updates.append(update)
+                self.succeeded_ids.append(answer["_id"])
+            except Exception as e:
+                print(f"Answer {answer['_id']} failed: {e}")
+                self.failed_ids.append(answer["_id"])
+            self.interview_ids.add(answer["interview_id"])
+            self.finished[seq] = answer["_id"]
+            self.finished_since_flush += 1
+            if self.finished_since_flush >= self.batch_size:
+                await self.flush()
+
+    async def flush(self):
+        async with self.flush_lock:
+            updates, self.updates = self.updates, []
+            succeeded_ids, self.succeeded_ids = self.succeeded_ids, []
+            failed_ids, self.failed_ids = self.failed_ids, []
+            interview_ids, self.interview_ids = self.interview_ids, set()
+            finished, self.finished_since_flush = self.finished_since_flush, 0
+            # Everything finished so far is written below, so the frontier may
+            # advance over all of it
+            while self.next_seq in self.finished:
+                self.frontier_id = self.finished.pop(self.next_seq)
+                self.next_seq += 1
+            if not finished:
+                return
+
+            if updates:
+                await self.db.answers.bulk_write(updates, ordered=False)
+            self.progress.reports += await refresh_feedback_reports(self.db, interview_ids)
+            self.progress.processed += finished
+            self.progress.failed += len(failed_ids)
+
+            update = {
+                "$set": {"updated_at": datetime.utcnow()},
+                "$setOnInsert": {"started_at": datetime.utcnow()},
+            }
+            if self.retry:
+                # Answers that fail again are already listed
+                update["$inc"] = {"failed": -len(succeeded_ids)}
+                if succeeded_ids:
+                    update["$pull"] = {"failed_ids": {"$in": succeeded_ids}}
+            else:
+                update["$inc"] = {"processed": finished, "failed": len(failed_ids)}
+                if self.frontier_id is not None:
+                    update["$set"]["last_id"] = self.frontier_id
+                if failed_ids:
+                    update["$push"] = {"failed_ids": {"$each": failed_ids}}
+            await self.db.reevaluation_jobs.update_one({"_id": self.job_id}, update, upsert=True)
+            print(self.progress.line())
+
+    async def _produce(self, answers):
+        seq = 0
+        async for answer in answers:
+            await self.queue.put((seq, answer))
+            seq += 1
+        for _ in range(self.concurrency):
+            await self.queue.put(None)
+
+    async def run(self, answers):
+        tasks = [asyncio.create_task(self._produce(answers))]
+        tasks += [asyncio.create_task(self._worker()) for _ in range(self.concurrency)]
+        try:
+            # If anything fails (e.g. a bulk_write), stop everything rather than
+            # leave the producer blocked on a queue nobody drains
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+        await self.flush()
+
+async def reevaluate_answers(
+    db: AsyncIOMotorDatabase,
+    job_id: str = "default",
+    concurrency: int = 2,
+    batch_size: int = 50,
+    since: Optional[datetime] = None,
+    max_per_second: Optional[float] = None,
+    restart: bool = False,
+    retry_failed: bool = False,
+    llm: Optional[LLMProvider] = None,
+) -> Progress:
+    """
+    Re-score stored answers with the current prompt and model.
+
+    Answers are read in _id order, one batch per query, and fed to a pool of
+    `concurrency` workers. Every `batch_size` finished answers the new
+    evaluations are written with one bulk_write, affected feedback reports are
+    rebuilt and the highest contiguous finished _id is checkpointed in
+    `reevaluation_jobs`, so an interrupted run resumes where it stopped.
+
+    `retry_failed` re-scores only the answers listed in the job's failed_ids
+    (ignoring `since`) and removes the ones that now succeed.
+    """
+    llm = llm or get_llm_service()
+    if restart:
+        await db.reevaluation_jobs.delete_one({"_id": job_id})
+    job = await db.reevaluation_jobs.find_one({"_id": job_id}) or {}
+
+    query = {}
+    if retry_failed:
+        query["_id"] = {"$in": job.get("failed_ids", [])}
+    else:
+        if job.get("last_id"):
+            query["_id"] = {"$gt": job["last_id"]}
+        if since:
+            query["created_at"] = {"$gte": since}
+
+    progress = Progress(total=await db.answers.count_documents(query))
+    if retry_failed:
+        print(f"Retrying {progress.total} failed answers of job '{job_id}'")
+    elif job.get("last_id"):
+        print(f"Resuming job '{job_id}' after {job.get('processed', 0)} answers")
+
+    pool = _WorkerPool(db, job_id, llm, concurrency, batch_size, Pacer(max_per_second), progress,
+                       retry=retry_failed)
+    await pool.run(_answers_by_id(db, query, batch_size))
+
+    if not retry_failed:
+        await db.reevaluation_jobs.update_one(
+            {"_id": job_id}, {"$set": {"finished_at": datetime.utcnow()}}, upsert=True
+        )
+    return progress
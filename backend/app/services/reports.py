@@ -0,0 +1,35 @@
+from typing import List, Optional
+
+def build_feedback_report(answers: List[dict]) -> Optional[dict]:
+    """
+    Aggregate evaluated answers into an interview's feedback report.
+    Returns None when no questions were answered.
+    """
+    if not answers:
+        return None
+
+    # Calculate Stats
+    total_score = sum(a["ai_evaluation"]["score"] for a in answers)
+    average_score = round(total_score / len(answers), 1)
+    
+    # Aggregate Feedback (Simple Calculation for Speed)
+    # We could use LLM here for a summary, but let's stick to stats for instant results
+    # as per user request for "faster".
+    weak_areas = []
+    strong_areas = []
+    for a in answers:
+        if a["ai_evaluation"]["score"] < 6:
+            weak_areas.extend(a["ai_evaluation"].get("missing_points", []))
+        else:
+            strong_areas.append("Good understanding of tested concepts")
+    
+    # Deduplicate
+    weak_areas = list(set(weak_areas))[:5] 
+    
+    return {
+        "overall_score": average_score,
+        "total_questions": len(answers),
+        "summary": f"Candidate scored {average_score}/10 on average.",
+        "weak_areas": weak_areas,
+        "strengths": list(set(strong_areas))[:3]
+    }
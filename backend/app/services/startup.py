@@ -0,0 +1,135 @@
+import asyncio
+import os
+import socket
+import uuid
+from datetime import datetime, timedelta
+from typing import Optional
+from app.core.config import settings
+from app.db import shared_state
+from app.db.mongodb import get_database, ensure_indexes, check_database
+from app.services import warmup
+
+# Unique per process start, even when a restarted container reuses hostname and pid
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+STARTUP_ID = settings.STARTUP_ID or socket.gethostname()
+LEADER_KEY = f"leader:{STARTUP_ID}"
+LLM_READY_KEY = f"llm_ready:{STARTUP_ID}"
+
+MAX_RETRY_DELAY_SECONDS = 60
+# Shutdown must not hang on an unreachable database
+RELEASE_TIMEOUT_SECONDS = 2
+
+class WorkerState:
+    mongo_warm: bool = False
+    is_leader: bool = False
+    task: Optional[asyncio.Task] = None
+    leader_task: Optional[asyncio.Task] = None
+
+state = WorkerState()
+
+async def _retry(action, description: str):
+    delay = 1
+    while True:
+        try:
+            return await action()
+        except Exception as e:
+            print(f"{description} failed, retrying in {delay}s: {e}")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, MAX_RETRY_DELAY_SECONDS)
+
+async def run_leader_tasks(database):
+    """
+    Duties of the elected leader: build indexes, warm the LLMs, then keep
+    them resident. Runs until leadership is lost.
+    """
+    print(f"Worker {WORKER_ID} is leader, running startup tasks")
+    await _retry(lambda: ensure_indexes(database), "Index build")
+    if settings.LLM_WARMUP_ENABLED:
+
+        async def mark_warm():
+            await shared_state.set_state(database, LLM_READY_KEY, {"warmed_at": datetime.utcnow()})
+
+        await _retry(warmup.warm_up_all, "LLM warmup")
+        await mark_warm()
+        print("Startup tasks complete")
+        if settings.LLM_KEEPALIVE_ENABLED:
+            await warmup.keep_alive_loop(on_warm=mark_warm)
+
+async def _cancel(task: Optional[asyncio.Task]):
+    if task and not task.done():
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+async def run_startup_tasks():
+    database = await get_database()
+
+    # Every worker has its own Motor pool; open a connection before reporting ready
+    await _retry(lambda: database.command("ping"), "MongoDB ping")
+    state.mongo_warm = True
+
+    # Every worker keeps trying for the lease, so a dead leader's duties are
+    # taken over once its lease runs out. The leader renews it on the same beat.
+    while True:
+        try:
+            leader = await shared_state.claim_job(database, LEADER_KEY, WORKER_ID, settings.LEADER_LEASE_SECONDS)
+        except Exception as e:
+            print(f"Leader lease check failed: {e}")
+            leader = False
+
+        if leader and not state.is_leader:
+            state.is_leader = True
+            state.leader_task = asyncio.create_task(run_leader_tasks(database))
+        elif not leader and state.is_leader:
+            print(f"Worker {WORKER_ID} lost leadership")
+            state.is_leader = False
+            await _cancel(state.leader_task)
+        await asyncio.sleep(settings.LEADER_LEASE_SECONDS / 3)
+
+def start():
+    """
+    Run startup tasks in the background so the worker can accept traffic
+    immediately; /ready reports when they are done.
+    """
+    state.task = asyncio.create_task(run_startup_tasks())
+
+async def stop():
+    await _cancel(state.task)
+    await _cancel(state.leader_task)
+    if state.is_leader:
+        # Let another worker take over now rather than when the lease expires
+        state.is_leader = False
+        try:
+            database = await get_database()
+            await asyncio.wait_for(
+                shared_state.release_claim(database, LEADER_KEY, WORKER_ID),
+                timeout=RELEASE_TIMEOUT_SECONDS
+            )
+        except Exception as e:
+            print(f"Releasing leader lease failed: {e}")
+
+async def check_readiness() -> dict:
+    checks = {"mongo": False, "llm": not settings.LLM_WARMUP_ENABLED}
+    if not state.mongo_warm:
+        return checks
+
+    checks["mongo"] = (await check_database())["ok"]
+    if checks["mongo"] and settings.LLM_WARMUP_ENABLED:
+        try:
+            # A warmup counts while the models are still resident, whichever
+            # leader ran it, so a leader change doesn't take every worker out
+            # of rotation. The leader refreshes it on every keep-alive pass;
+            # without keep-alive nothing keeps the models loaded, so only the
+            # first warmup is required.
+            database = await get_database()
+            warmed_at = (await shared_state.get_state(database, LLM_READY_KEY, {})).get("warmed_at")
+            if warmed_at and settings.LLM_KEEPALIVE_ENABLED:
+                max_age = timedelta(seconds=settings.LLM_MODEL_RESIDENCY_SECONDS)
+                checks["llm"] = datetime.utcnow() - warmed_at < max_age
+            else:
+                checks["llm"] = warmed_at is not None
+        except Exception:
+            pass
+    return checks
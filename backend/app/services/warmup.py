@@ -0,0 +1,34 @@
+import asyncio
+from app.core.config import settings
+from app.services.ai_service import get_configured_providers
+
+async def warm_up_all():
+    """
+    Load every configured model. Raises if any of them fails so the caller
+    can retry.
+    """
+    for provider in get_configured_providers():
+        await provider.warmup()
+        print(f"Warmed up {provider.name}/{provider.model_name}")
+
+async def keep_alive_loop(on_warm=None):
+    """
+    Ping models that have gone idle so the backend keeps them resident
+    through low-traffic periods. Busy models are left alone. `on_warm` is
+    awaited after every pass in which all models were busy or answered.
+    """
+    providers = get_configured_providers()
+    interval = settings.LLM_KEEPALIVE_INTERVAL_SECONDS
+    while True:
+        await asyncio.sleep(interval / 4)
+        all_warm = True
+        for provider in providers:
+            if await provider.shared_idle_seconds() < interval:
+                continue
+            try:
+                await provider.warmup(kind="keepalive")
+            except Exception as e:
+                all_warm = False
+                print(f"Keep-alive for {provider.name}/{provider.model_name} failed: {e}")
+        if all_warm and on_warm:
+            await on_warm()
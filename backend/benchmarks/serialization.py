@@ -0,0 +1,101 @@
+"""
+Microbenchmark for the API response path.
+
+Compares the old path (build models, then let FastAPI re-validate them through
+`response_model` and encode with the stdlib JSONResponse) against the fast path
+(validate once, render with MongoJSONResponse/orjson) for the interview list
+and detail endpoints. Runs fully in-memory, no MongoDB or LLM required.
+
+    python benchmarks/serialization.py [--items 50] [--rounds 2000]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bson import ObjectId
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+from app.core.responses import model_response
+from app.models.interview import Interview
+
+def make_docs(count: int) -> List[dict]:
+    now = datetime.utcnow()
+    return [
+        {
+            "_id": ObjectId(),
+            "user_id": "guest_id_00000000000000",
+            "role": "Backend Developer",
+            "difficulty": "Medium",
+            "status": "Completed",
+            "started_at": now - timedelta(days=i),
+            "completed_at": now - timedelta(days=i, minutes=-30),
+            "version": 2,
+            "feedback_report": {
+                "overall_score": 7.5,
+                "total_questions": 10,
+                "summary": "Candidate scored 7.5/10 on average.",
+                "weak_areas": ["Indexing strategies", "Transactions"],
+                "strengths": ["Good understanding of tested concepts"],
+            },
+        }
+        for i in range(count)
+    ]
+
+def build_app(docs: List[dict]) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/legacy/interviews", response_model=List[Interview], response_class=JSONResponse)
+    async def legacy_list():
+        interviews = []
+        for doc in docs:
+            doc = dict(doc, _id=str(doc["_id"]))
+            interviews.append(Interview(**doc))
+        return interviews
+
+    @app.get("/legacy/interviews/one", response_model=Interview, response_class=JSONResponse)
+    async def legacy_detail():
+        doc = dict(docs[0], _id=str(docs[0]["_id"]))
+        return Interview(**doc)
+
+    @app.get("/fast/interviews", response_model=List[Interview])
+    async def fast_list():
+        return model_response([Interview.model_validate(doc) for doc in docs])
+
+    @app.get("/fast/interviews/one", response_model=Interview)
+    async def fast_detail():
+        return model_response(Interview.model_validate(docs[0]))
+
+    return app
+
+def bench(client: TestClient, path: str, rounds: int) -> float:
+    for _ in range(50):
+        client.get(path)
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        client.get(path)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1e6
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=50, help="interviews in the list response")
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+
+    client = TestClient(build_app(make_docs(args.items)))
+    print(f"median request time over {args.rounds} rounds ({args.items} list items)")
+    for name, suffix in (("list", "/interviews"), ("detail", "/interviews/one")):
+        legacy = bench(client, "/legacy" + suffix, args.rounds)
+        fast = bench(client, "/fast" + suffix, args.rounds)
+        print(f"  {name:<7} legacy {legacy:8.1f} us   fast {fast:8.1f} us   speedup {legacy / fast:4.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Cold-start benchmark.
+
+Measures, each in a fresh interpreter:
+  * import time of `app.main`
+  * time from spawning `uvicorn app.main:app` to the first 200 on `/`
+
+and compares the medians against the committed baseline in
+startup_baseline.json. No MongoDB or LLM is needed: startup tasks run in the
+background and `/` does not touch either.
+
+    python benchmarks/startup.py                    # measure and compare
+    python benchmarks/startup.py --update-baseline  # record new baseline
+"""
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "startup_baseline.json")
+
+IMPORT_SNIPPET = (
+    "import time; start = time.perf_counter(); import app.main; "
+    "print((time.perf_counter() - start) * 1000)"
+)
+
+def _env() -> dict:
+    # Keep the server from reaching out to an LLM during the measurement
+    return dict(os.environ, PYTHONDONTWRITEBYTECODE="1", LLM_WARMUP_ENABLED="false")
+
+def measure_import() -> float:
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_SNIPPET],
+        cwd=BACKEND_DIR, env=_env(), capture_output=True, text=True, check=True
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def measure_first_200(timeout: float = 30.0) -> float:
+    port = _free_port()
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=BACKEND_DIR, env=_env(), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        while time.perf_counter() - start < timeout:
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/", timeout=1) as response:
+                    if response.status == 200:
+                        return (time.perf_counter() - start) * 1000
+            except OSError:
+                time.sleep(0.005)
+        raise RuntimeError(f"server did not answer 200 within {timeout}s")
+    finally:
+        server.terminate()
+        server.wait()
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure import time and time-to-first-200.")
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown over baseline before failing (0.25 = 25%%)")
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+
+    # Warm the OS file cache so the first run isn't an outlier
+    measure_import()
+    results = {
+        "import_ms": round(statistics.median(measure_import() for _ in range(args.runs)), 1),
+        "first_200_ms": round(statistics.median(measure_first_200() for _ in range(args.runs)), 1),
+    }
+    print(f"median of {args.runs} runs: import {results['import_ms']} ms, first 200 {results['first_200_ms']} ms")
+
+    if args.update_baseline:
+        results["python"] = sys.version.split()[0]
+        with open(BASELINE_PATH, "w") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+        print(f"baseline written to {BASELINE_PATH}")
+        return
+
+    if not os.path.exists(BASELINE_PATH):
+        print("no baseline recorded, run with --update-baseline")
+        return
+    with open(BASELINE_PATH) as f:
+        baseline = json.load(f)
+
+    regressed = False
+    for key in ("import_ms", "first_200_ms"):
+        limit = baseline[key] * (1 + args.tolerance)
+        status = "ok" if results[key] <= limit else "REGRESSION"
+        regressed |= status != "ok"
+        print(f"  {key:<13} {results[key]:8.1f} ms  baseline {baseline[key]:8.1f} ms  {status}")
+    sys.exit(1 if regressed else 0)
+
+if __name__ == "__main__":
+    main()
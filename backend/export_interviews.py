@@ -0,0 +1,56 @@
+"""
+Export a user's interview history straight from MongoDB.
+
+    python export_interviews.py --user-id <id> --format csv --start 2024-01-01 -o history.csv
+
+Writes NDJSON (one interview per line) or CSV (one answer per row) with
+constant memory. Every record carries its interview's offset; use --offset
+to resume: the last NDJSON line's offset + 1, or for CSV the last offset
+written, after deleting that interview's possibly incomplete rows.
+"""
+import sys
+import os
+import argparse
+import asyncio
+from contextlib import redirect_stdout
+from datetime import datetime
+from dotenv import load_dotenv
+
+# Ensure we can import from the app directory
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+# Load env vars
+load_dotenv()
+
+from app.db.mongodb import connect_to_mongo, close_mongo_connection, get_read_database
+from app.services.export import EXPORT_MEDIA_TYPES, stream_export
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Export a user's interview history.")
+    parser.add_argument("--user-id", required=True)
+    parser.add_argument("--format", choices=sorted(EXPORT_MEDIA_TYPES), default="ndjson")
+    parser.add_argument("--start", type=datetime.fromisoformat, help="interviews started at or after this ISO date")
+    parser.add_argument("--end", type=datetime.fromisoformat, help="interviews started before this ISO date")
+    parser.add_argument("--offset", type=int, default=0, help="skip this many interviews (resume point)")
+    parser.add_argument("-o", "--output", help="file to write, default stdout")
+    return parser.parse_args()
+
+async def main():
+    args = parse_args()
+    # Keep status messages out of the exported data when writing to stdout
+    with redirect_stdout(sys.stderr):
+        await connect_to_mongo()
+    out = open(args.output, "wb") if args.output else sys.stdout.buffer
+    try:
+        async for chunk in stream_export(
+            await get_read_database(), args.user_id, args.format, args.start, args.end, args.offset
+        ):
+            out.write(chunk)
+    finally:
+        if args.output:
+            out.close()
+        with redirect_stdout(sys.stderr):
+            await close_mongo_connection()
+
+if __name__ == "__main__":
+    asyncio.run(main())
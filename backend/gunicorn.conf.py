@@ -0,0 +1,19 @@
+# Production serving profile: N Uvicorn workers under Gunicorn.
+#   gunicorn -c gunicorn.conf.py app.main:app
+import multiprocessing
+import os
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_class = "uvicorn_worker.UvicornWorker"
+
+# Not preloaded: each worker must create its own Motor client on its own event loop
+preload_app = False
+
+# LLM completions can take a while; don't kill workers that are waiting on them
+timeout = int(os.getenv("WORKER_TIMEOUT", 120))
+graceful_timeout = 30
+keepalive = 5
+
+accesslog = "-"
+errorlog = "-"
@@ -0,0 +1,57 @@
+"""
+Re-score stored answers after a prompt or model change.
+
+    python reevaluate_answers.py --job-id prompt-v2 --concurrency 2 --max-per-second 1
+
+Progress is checkpointed per --job-id; rerunning the same command resumes
+where it stopped. Use --restart to start the job over, or --retry-failed to
+re-score only the answers the job could not evaluate.
+"""
+import sys
+import os
+import argparse
+import asyncio
+from datetime import datetime
+from dotenv import load_dotenv
+
+# Ensure we can import from the app directory
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+# Load env vars
+load_dotenv()
+
+from app.db.mongodb import connect_to_mongo, close_mongo_connection, get_database
+from app.services.reevaluation import reevaluate_answers
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Re-evaluate stored interview answers.")
+    parser.add_argument("--job-id", default="default", help="checkpoint name, reuse it to resume")
+    parser.add_argument("--concurrency", type=int, default=2, help="evaluations in flight at once")
+    parser.add_argument("--batch-size", type=int, default=50, help="answers per bulk write / checkpoint")
+    parser.add_argument("--since", type=datetime.fromisoformat, help="only answers created at or after this ISO date")
+    parser.add_argument("--max-per-second", type=float, help="cap on evaluations started per second")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--restart", action="store_true", help="discard the job's checkpoint first")
+    mode.add_argument("--retry-failed", action="store_true", help="re-score only the job's failed answers")
+    return parser.parse_args()
+
+async def main():
+    args = parse_args()
+    await connect_to_mongo()
+    try:
+        progress = await reevaluate_answers(
+            await get_database(),
+            job_id=args.job_id,
+            concurrency=args.concurrency,
+            batch_size=args.batch_size,
+            since=args.since,
+            max_per_second=args.max_per_second,
+            restart=args.restart,
+            retry_failed=args.retry_failed,
+        )
+        print(f"Done: {progress.line()}")
+    finally:
+        await close_mongo_connection()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,85 @@
+import sys
+import os
+import asyncio
+import random
+from types import SimpleNamespace
+from bson import ObjectId
+
+# Ensure we can import from the app directory
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.services.reevaluation import Pacer, Progress, _WorkerPool
+
+EVALUATION = {
+    "score": 8,
+    "correctness": "Correct",
+    "feedback": "Good",
+    "ideal_answer": "...",
+    "improvement_tips": [],
+    "missing_points": [],
+}
+
+class FakeLLM:
+    """Answers after a random delay so workers finish out of order."""
+    async def evaluate_answer(self, role, question, user_answer):
+        await asyncio.sleep(random.uniform(0, 0.02))
+        return dict(EVALUATION)
+
+class FakeCursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    async def to_list(self, length=None):
+        return list(self.docs)
+
+class FakeCollection:
+    def __init__(self, docs=()):
+        self.docs = {doc["_id"]: doc for doc in docs}
+
+    async def find_one(self, query, projection=None):
+        return self.docs.get(query["_id"])
+
+    def find(self, query, projection=None):
+        return FakeCursor([doc for doc in self.docs.values()
+                           if all(doc.get(k) == v for k, v in query.items())])
+
+    async def bulk_write(self, requests, ordered=True):
+        for request in requests:
+            self.docs[request._filter["_id"]].update(request._doc["$set"])
+
+    async def update_one(self, query, update, upsert=False):
+        return SimpleNamespace(modified_count=0)
+
+async def run_pool(count: int = 21, concurrency: int = 3, batch_size: int = 4):
+    interview_id, question_id = ObjectId(), ObjectId()
+    answers = [
+        {"_id": ObjectId(), "interview_id": str(interview_id), "question_id": str(question_id),
+         "user_answer_text": f"answer {i}", "ai_evaluation": dict(EVALUATION, score=1)}
+        for i in range(count)
+    ]
+    db = SimpleNamespace(
+        questions=FakeCollection([{"_id": question_id, "question_text": "Q"}]),
+        interviews=FakeCollection([{"_id": interview_id, "role": "Backend Developer"}]),
+        answers=FakeCollection([dict(answer) for answer in answers]),
+        reevaluation_jobs=FakeCollection(),
+    )
+
+    async def cursor():
+        for answer in answers:
+            yield answer
+
+    progress = Progress(total=count)
+    pool = _WorkerPool(db, "test", FakeLLM(), concurrency, batch_size, Pacer(None), progress)
+    await pool.run(cursor())
+    return db, answers, progress, pool
+
+def test_worker_pool_writes_every_evaluation():
+    db, answers, progress, pool = asyncio.run(run_pool())
+    rewritten = [doc for doc in db.answers.docs.values() if doc["ai_evaluation"]["score"] == 8]
+    assert progress.processed == len(answers) and progress.failed == 0
+    assert len(rewritten) == len(answers), f"only {len(rewritten)}/{len(answers)} answers rewritten"
+    assert pool.frontier_id == answers[-1]["_id"]
+
+if __name__ == "__main__":
+    test_worker_pool_writes_every_evaluation()
+    print("✅ every answer re-evaluated")